@@ -1,15 +1,11 @@
 #!/usr/bin/env python3
 
 import sqlite3
-import argparse
+import functools
 import os
 import sys
-import json
-import subprocess
-from datetime import datetime, date
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-import textwrap
+from typing import Dict, Optional
 
 class Colors:
     RED = '\033[0;31m'
@@ -20,16 +16,119 @@ class Colors:
     PURPLE = '\033[0;35m'
     NC = '\033[0m'  # No Color
 
+# Plain output when piped or when NO_COLOR is set (https://no-color.org).
+# Must run before ProjectTracker captures the codes in its class constants.
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _color in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'CYAN', 'PURPLE', 'NC'):
+        setattr(Colors, _color, '')
+
+@functools.lru_cache(maxsize=256)
+def _git_info_cached(path: str) -> Optional[Dict]:
+    """Get Git repository information for an absolute path, memoized per run."""
+    import subprocess
+
+    try:
+        # Branch, latest commit and working tree status in one call
+        output = subprocess.check_output(['git', '-C', path, 'status', '--porcelain=v2', '--branch'],
+                                         stderr=subprocess.DEVNULL, text=True)
+        branch = commit = None
+        has_changes = False
+        for line in output.splitlines():
+            if line.startswith('# branch.head '):
+                branch = line[len('# branch.head '):]
+            elif line.startswith('# branch.oid '):
+                commit = line[len('# branch.oid '):]
+            elif not line.startswith('#'):
+                has_changes = True
+        # Repositories without any commit have no HEAD to report
+        if commit is None or commit == '(initial)':
+            return None
+        return {
+            'branch': '' if branch == '(detached)' else branch,
+            'commit': commit[:8],
+            'has_changes': has_changes
+        }
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+# Task status shortcuts: command -> new status
+STATUS_COMMANDS = {
+    'complete': 'completed',
+    'start': 'in_progress',
+    'block': 'blocked'
+}
+
 class ProjectTracker:
+    STATUS_COLORS = {
+        'pending': Colors.YELLOW,
+        'in_progress': Colors.BLUE,
+        'completed': Colors.GREEN,
+        'blocked': Colors.RED
+    }
+
+    PRIORITY_COLORS = {
+        'high': Colors.RED,
+        'medium': Colors.YELLOW,
+        'low': Colors.CYAN
+    }
+
+    PRIORITY_SYMBOLS = {
+        'high': '🔥',
+        'medium': '⚡',
+        'low': '📝'
+    }
+
+    # Row header templates, pre-colored once instead of per row
+    PROJECT_HEADER = Colors.CYAN + '[{id}]' + Colors.NC + ' {name} {color}({status})' + Colors.NC
+    TASK_HEADER = Colors.CYAN + '[{id}]' + Colors.NC + ' {symbol} {title} {color}({status})' + Colors.NC
+
     def __init__(self):
         self.data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.data_dir / 'tracker.db'
+        self._conn = None
         self.init_database()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazily open the shared database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.row_factory = sqlite3.Row
+            self.configure_connection(self._conn)
+        return self._conn
+
+    @staticmethod
+    def configure_connection(conn: sqlite3.Connection):
+        """Apply performance PRAGMAs to a freshly opened connection."""
+        # journal_mode is persistent in the database file, so only switch once
+        journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA foreign_keys=ON')
+
+    def close(self):
+        """Close the shared database connection if it is open."""
+        if getattr(self, '_conn', None) is not None:
+            self._conn.close()
+            self._conn = None
+
     def init_database(self):
         """Initialize SQLite database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         # Projects table
@@ -76,37 +175,62 @@ class ProjectTracker:
             )
         ''')
 
+        # Indexes for the per-project and per-status lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks(project_id, status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name COLLATE NOCASE)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_git_pid_ts ON git_activity(project_id, timestamp DESC)')
+        cursor.execute('DROP INDEX IF EXISTS idx_git_activity_project')  # Covered by idx_git_pid_ts
+
         conn.commit()
-        conn.close()
+
+    @staticmethod
+    def colorize(message: str, color: str = Colors.NC) -> str:
+        """Wrap a message in color codes the same way log() prints it."""
+        return f"{color}{message}{Colors.NC}"
 
     def log(self, message: str, color: str = Colors.NC):
         """Print colored log message."""
-        print(f"{color}{message}{Colors.NC}")
+        print(self.colorize(message, color))
 
     def get_git_info(self, path: str) -> Optional[Dict]:
         """Get Git repository information from a path."""
-        try:
-            os.chdir(path)
-            # Get current branch
-            branch = subprocess.check_output(['git', 'branch', '--show-current'],
-                                          stderr=subprocess.DEVNULL).decode().strip()
-            # Get latest commit
-            commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
-                                          stderr=subprocess.DEVNULL).decode().strip()
-            # Get repo status
-            status = subprocess.check_output(['git', 'status', '--porcelain'],
-                                          stderr=subprocess.DEVNULL).decode().strip()
-            return {
-                'branch': branch,
-                'commit': commit[:8],
-                'has_changes': bool(status)
-            }
-        except:
+        # A single stat on .git covers both "path exists" and "is a repo"
+        if not os.path.exists(os.path.join(path, '.git')):
             return None
+        return _git_info_cached(os.path.realpath(path))
+
+    def _resolve_project(self, project_ref: str) -> Optional[sqlite3.Row]:
+        """Resolve a project ID or name to its (id, name) row.
+
+        Tries the primary key, then an exact and a prefix name match (both
+        indexed), and only falls back to a substring match when none finds a
+        project.
+        """
+        cursor = self.conn.cursor()
+
+        try:
+            cursor.execute('SELECT id, name FROM projects WHERE id = ?', (int(project_ref),))
+            return cursor.fetchone()
+        except ValueError:
+            pass
+
+        cursor.execute('SELECT id, name FROM projects WHERE name = ?', (project_ref,))
+        result = cursor.fetchone()
+        if result:
+            return result
+
+        for pattern in (f'{project_ref}%', f'%{project_ref}%'):
+            cursor.execute('SELECT id, name FROM projects WHERE name LIKE ? LIMIT 1', (pattern,))
+            result = cursor.fetchone()
+            if result:
+                return result
+        return None
 
     def add_project(self, name: str, path: str = None, description: str = None):
         """Add a new project."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         try:
@@ -120,19 +244,18 @@ class ProjectTracker:
             self.log(f"✓ Added project '{name}' (ID: {project_id})", Colors.GREEN)
 
             # If path provided, check for Git info
-            if path and os.path.exists(path):
+            if path:
                 git_info = self.get_git_info(path)
                 if git_info:
                     self.log(f"  Git: {git_info['branch']} ({git_info['commit']})", Colors.CYAN)
 
         except sqlite3.IntegrityError:
+            conn.rollback()
             self.log(f"✗ Project '{name}' already exists", Colors.RED)
-        finally:
-            conn.close()
 
     def list_projects(self, status_filter: str = None):
         """List all projects with their status."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         query = 'SELECT * FROM projects'
@@ -147,109 +270,133 @@ class ProjectTracker:
 
         if not projects:
             self.log("No projects found", Colors.YELLOW)
-            conn.close()
             return
 
         self.log(f"{Colors.BLUE}📁 Projects Overview{Colors.NC}")
         self.log("=" * 50)
 
-        for project in projects:
-            pid, name, path, desc, status, created, updated = project
+        # Task counts for all projects in one pass
+        cursor.execute('''
+            SELECT project_id, COUNT(*), SUM(status = 'completed')
+            FROM tasks
+            GROUP BY project_id
+        ''')
+        counts = {pid: (total, done) for pid, total, done in cursor.fetchall()}
+
+        # Probe Git repositories concurrently
+        paths = list({project['path'] for project in projects if project['path']})
+        git_infos = {}
+        if paths:
+            from concurrent.futures import ThreadPoolExecutor
 
-            # Get task count
-            cursor.execute('SELECT COUNT(*) FROM tasks WHERE project_id = ?', (pid,))
-            task_count = cursor.fetchone()[0]
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                git_infos = dict(zip(paths, executor.map(self.get_git_info, paths)))
 
-            cursor.execute('SELECT COUNT(*) FROM tasks WHERE project_id = ? AND status = "completed"', (pid,))
-            completed_count = cursor.fetchone()[0]
+        # Render every row first, then emit the listing with a single write
+        rows = [self._format_project(project, counts, git_infos) for project in projects]
+        sys.stdout.write(''.join(row + '\n\n' for row in rows))
 
-            # Status color
-            status_color = Colors.GREEN if status == 'active' else Colors.YELLOW
+    def _format_project(self, project: sqlite3.Row, counts: Dict, git_infos: Dict) -> str:
+        """Render one project row of the projects listing."""
+        pid, name, path, desc, status = (project['id'], project['name'], project['path'],
+                                         project['description'], project['status'])
 
-            self.log(f"{Colors.CYAN}[{pid}]{Colors.NC} {name} {status_color}({status}){Colors.NC}")
-            if desc:
-                wrapped_desc = textwrap.fill(desc, width=60, initial_indent="    ", subsequent_indent="    ")
-                print(wrapped_desc)
+        task_count, completed_count = counts.get(pid, (0, 0))
 
-            if path:
-                self.log(f"    📂 {path}", Colors.BLUE)
+        # Status color
+        status_color = Colors.GREEN if status == 'active' else Colors.YELLOW
 
-            self.log(f"    📊 Tasks: {completed_count}/{task_count} completed")
+        lines = [self.colorize(self.PROJECT_HEADER.format(id=pid, name=name, color=status_color, status=status))]
+        if desc:
+            import textwrap
 
-            # Git info if available
-            if path and os.path.exists(path):
-                git_info = self.get_git_info(path)
-                if git_info:
-                    changes_indicator = " (uncommitted changes)" if git_info['has_changes'] else ""
-                    self.log(f"    🌿 Git: {git_info['branch']} ({git_info['commit']}){changes_indicator}", Colors.PURPLE)
+            lines.append(textwrap.fill(desc, width=60, initial_indent="    ", subsequent_indent="    "))
 
-            print()
+        if path:
+            lines.append(self.colorize(f"    📂 {path}", Colors.BLUE))
+
+        lines.append(self.colorize(f"    📊 Tasks: {completed_count}/{task_count} completed"))
+
+        # Git info if available
+        git_info = git_infos.get(path)
+        if git_info:
+            changes_indicator = " (uncommitted changes)" if git_info['has_changes'] else ""
+            lines.append(self.colorize(f"    🌿 Git: {git_info['branch']} ({git_info['commit']}){changes_indicator}",
+                                       Colors.PURPLE))
 
-        conn.close()
+        return '\n'.join(lines)
 
     def add_task(self, project_ref: str, title: str, description: str = None,
                  priority: str = 'medium', due_date: str = None):
         """Add a task to a project."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         # Find project by ID or name
-        try:
-            project_id = int(project_ref)
-            cursor.execute('SELECT name FROM projects WHERE id = ?', (project_id,))
-        except ValueError:
-            cursor.execute('SELECT id, name FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
-            result = cursor.fetchone()
-            if result:
-                project_id, project_name = result
-            else:
-                self.log(f"✗ Project '{project_ref}' not found", Colors.RED)
-                conn.close()
-                return
+        project = self._resolve_project(project_ref)
+        if not project:
+            self.log(f"✗ Project '{project_ref}' not found", Colors.RED)
+            return
+        project_id, project_name = project
 
         # Parse due date if provided
         parsed_due_date = None
         if due_date:
+            from datetime import datetime
+
             try:
                 parsed_due_date = datetime.strptime(due_date, '%Y-%m-%d').date()
             except ValueError:
                 self.log(f"✗ Invalid date format. Use YYYY-MM-DD", Colors.RED)
-                conn.close()
                 return
 
-        cursor.execute('''
-            INSERT INTO tasks (project_id, title, description, priority, due_date)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (project_id, title, description, priority, parsed_due_date))
-
-        task_id = cursor.lastrowid
-        conn.commit()
+        # Insert the task and touch the project in a single transaction
+        with conn:
+            cursor.execute('''
+                INSERT INTO tasks (project_id, title, description, priority, due_date)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (project_id, title, description, priority, parsed_due_date))
+            task_id = cursor.lastrowid
 
-        # Update project timestamp
-        cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_id,))
-        conn.commit()
+            # Update project timestamp
+            cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_id,))
 
-        priority_color = {
-            'high': Colors.RED,
-            'medium': Colors.YELLOW,
-            'low': Colors.CYAN
-        }.get(priority, Colors.NC)
+        priority_color = self.PRIORITY_COLORS.get(priority, Colors.NC)
 
         self.log(f"✓ Added task '{title}' to project (ID: {task_id})", Colors.GREEN)
         self.log(f"  Priority: {priority_color}{priority.upper()}{Colors.NC}")
         if due_date:
             self.log(f"  Due: {due_date}")
 
-        conn.close()
+    def add_tasks(self, project_id: int, items) -> int:
+        """Bulk-insert tasks into a project in one transaction.
+
+        Each item is a (title, description, priority, due_date) tuple.
+        Returns the number of tasks inserted.
+        """
+        rows = [(project_id, *item) for item in items]
+        if not rows:
+            return 0
+
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO tasks (project_id, title, description, priority, due_date)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_id,))
+
+        return len(rows)
 
     def list_tasks(self, project_ref: str = None, status_filter: str = None):
         """List tasks, optionally filtered by project and/or status."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         query = '''
             SELECT t.id, t.title, t.description, t.status, t.priority, t.due_date,
-                   p.name as project_name, t.created_at
+                   p.name as project_name, t.created_at,
+                   CAST(julianday(t.due_date) - julianday('now', 'localtime', 'start of day') AS INTEGER)
+                       as days_left
             FROM tasks t
             JOIN projects p ON t.project_id = p.id
         '''
@@ -257,13 +404,12 @@ class ProjectTracker:
 
         conditions = []
         if project_ref:
-            try:
-                project_id = int(project_ref)
-                conditions.append('t.project_id = ?')
-                params.append(project_id)
-            except ValueError:
-                conditions.append('p.name LIKE ?')
-                params.append(f'%{project_ref}%')
+            project = self._resolve_project(project_ref)
+            if not project:
+                self.log(f"✗ Project '{project_ref}' not found", Colors.RED)
+                return
+            conditions.append('t.project_id = ?')
+            params.append(project[0])
 
         if status_filter:
             conditions.append('t.status = ?')
@@ -272,61 +418,57 @@ class ProjectTracker:
         if conditions:
             query += ' WHERE ' + ' AND '.join(conditions)
 
-        query += ' ORDER BY t.priority DESC, t.due_date ASC, t.created_at DESC'
+        query += '''
+            ORDER BY CASE t.priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END,
+                     t.due_date ASC, t.created_at DESC
+        '''
 
         cursor.execute(query, params)
         tasks = cursor.fetchall()
 
         if not tasks:
             self.log("No tasks found", Colors.YELLOW)
-            conn.close()
             return
 
         self.log(f"{Colors.BLUE}📋 Tasks Overview{Colors.NC}")
         self.log("=" * 60)
 
-        for task in tasks:
-            tid, title, desc, status, priority, due_date, project_name, created = task
-
-            # Status colors
-            status_colors = {
-                'pending': Colors.YELLOW,
-                'in_progress': Colors.BLUE,
-                'completed': Colors.GREEN,
-                'blocked': Colors.RED
-            }
-
-            priority_symbols = {
-                'high': '🔥',
-                'medium': '⚡',
-                'low': '📝'
-            }
-
-            status_color = status_colors.get(status, Colors.NC)
-            priority_symbol = priority_symbols.get(priority, '📝')
-
-            self.log(f"{Colors.CYAN}[{tid}]{Colors.NC} {priority_symbol} {title} {status_color}({status}){Colors.NC}")
-            self.log(f"    📁 Project: {project_name}")
-
-            if desc:
-                wrapped_desc = textwrap.fill(desc, width=70, initial_indent="    📄 ", subsequent_indent="       ")
-                print(wrapped_desc)
-
-            if due_date:
-                due_obj = datetime.strptime(due_date, '%Y-%m-%d').date()
-                days_left = (due_obj - date.today()).days
-                if days_left < 0:
-                    self.log(f"    📅 Due: {due_date} ({Colors.RED}OVERDUE by {abs(days_left)} days{Colors.NC})")
-                elif days_left == 0:
-                    self.log(f"    📅 Due: {due_date} ({Colors.YELLOW}TODAY{Colors.NC})")
-                elif days_left <= 7:
-                    self.log(f"    📅 Due: {due_date} ({Colors.YELLOW}{days_left} days left{Colors.NC})")
-                else:
-                    self.log(f"    📅 Due: {due_date} ({days_left} days left)")
-
-            print()
-
-        conn.close()
+        # Render every row first, then emit the listing with a single write
+        rows = [self._format_task(task) for task in tasks]
+        sys.stdout.write(''.join(row + '\n\n' for row in rows))
+
+    def _format_task(self, task: sqlite3.Row) -> str:
+        """Render one task row of the tasks listing."""
+        tid, title, desc, status, priority = (task['id'], task['title'], task['description'],
+                                              task['status'], task['priority'])
+        due_date, days_left = task['due_date'], task['days_left']
+
+        status_color = self.STATUS_COLORS.get(status, Colors.NC)
+        priority_symbol = self.PRIORITY_SYMBOLS.get(priority, '📝')
+
+        lines = [
+            self.colorize(self.TASK_HEADER.format(id=tid, symbol=priority_symbol, title=title,
+                                                  color=status_color, status=status)),
+            self.colorize(f"    📁 Project: {task['project_name']}")
+        ]
+
+        if desc:
+            import textwrap
+
+            lines.append(textwrap.fill(desc, width=70, initial_indent="    📄 ", subsequent_indent="       "))
+
+        if days_left is not None:
+            if days_left < 0:
+                due_text = f"{Colors.RED}OVERDUE by {abs(days_left)} days{Colors.NC}"
+            elif days_left == 0:
+                due_text = f"{Colors.YELLOW}TODAY{Colors.NC}"
+            elif days_left <= 7:
+                due_text = f"{Colors.YELLOW}{days_left} days left{Colors.NC}"
+            else:
+                due_text = f"{days_left} days left"
+            lines.append(self.colorize(f"    📅 Due: {due_date} ({due_text})"))
+
+        return '\n'.join(lines)
 
     def update_task_status(self, task_id: int, new_status: str):
         """Update task status."""
@@ -335,36 +477,26 @@ class ProjectTracker:
             self.log(f"✗ Invalid status. Use: {', '.join(valid_statuses)}", Colors.RED)
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         cursor.execute('SELECT title, project_id FROM tasks WHERE id = ?', (task_id,))
         result = cursor.fetchone()
         if not result:
             self.log(f"✗ Task {task_id} not found", Colors.RED)
-            conn.close()
             return
 
         title, project_id = result
-        cursor.execute('UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
-                      (new_status, task_id))
+        with conn:
+            cursor.execute('UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                          (new_status, task_id))
 
-        # Update project timestamp
-        cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_id,))
-        conn.commit()
-
-        status_colors = {
-            'pending': Colors.YELLOW,
-            'in_progress': Colors.BLUE,
-            'completed': Colors.GREEN,
-            'blocked': Colors.RED
-        }
+            # Update project timestamp
+            cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_id,))
 
-        status_color = status_colors.get(new_status, Colors.NC)
+        status_color = self.STATUS_COLORS.get(new_status, Colors.NC)
         self.log(f"✓ Updated '{title}' to {status_color}{new_status}{Colors.NC}", Colors.GREEN)
 
-        conn.close()
-
     def project_status(self, project_ref: str = None):
         """Show detailed project status with Git integration."""
         if project_ref is None:
@@ -373,23 +505,19 @@ class ProjectTracker:
             self.show_overall_stats()
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         # Find project
-        try:
-            project_id = int(project_ref)
-            cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
-        except ValueError:
-            cursor.execute('SELECT * FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
-
-        project = cursor.fetchone()
-        if not project:
+        resolved = self._resolve_project(project_ref)
+        if not resolved:
             self.log(f"✗ Project '{project_ref}' not found", Colors.RED)
-            conn.close()
             return
 
-        pid, name, path, desc, status, created, updated = project
+        cursor.execute('SELECT * FROM projects WHERE id = ?', (resolved[0],))
+        project = cursor.fetchone()
+
+        pid, name, path, desc = project['id'], project['name'], project['path'], project['description']
 
         self.log(f"{Colors.BLUE}📁 {name} - Detailed Status{Colors.NC}")
         self.log("=" * 50)
@@ -401,15 +529,14 @@ class ProjectTracker:
             self.log(f"📂 Path: {path}")
 
         # Git information
-        if path and os.path.exists(path):
-            git_info = self.get_git_info(path)
-            if git_info:
-                self.log(f"🌿 Git Branch: {git_info['branch']}")
-                self.log(f"📝 Latest Commit: {git_info['commit']}")
-                if git_info['has_changes']:
-                    self.log(f"{Colors.YELLOW}⚠ Uncommitted changes present{Colors.NC}")
-                else:
-                    self.log(f"{Colors.GREEN}✓ Working directory clean{Colors.NC}")
+        git_info = self.get_git_info(path) if path else None
+        if git_info:
+            self.log(f"🌿 Git Branch: {git_info['branch']}")
+            self.log(f"📝 Latest Commit: {git_info['commit']}")
+            if git_info['has_changes']:
+                self.log(f"{Colors.YELLOW}⚠ Uncommitted changes present{Colors.NC}")
+            else:
+                self.log(f"{Colors.GREEN}✓ Working directory clean{Colors.NC}")
 
         # Task statistics
         cursor.execute('SELECT status, COUNT(*) FROM tasks WHERE project_id = ? GROUP BY status', (pid,))
@@ -420,34 +547,27 @@ class ProjectTracker:
             self.log(f"\n📊 Task Statistics (Total: {total_tasks})")
             for status, count in status_counts.items():
                 percentage = (count / total_tasks) * 100
-                status_colors = {
-                    'pending': Colors.YELLOW,
-                    'in_progress': Colors.BLUE,
-                    'completed': Colors.GREEN,
-                    'blocked': Colors.RED
-                }
-                color = status_colors.get(status, Colors.NC)
+                color = self.STATUS_COLORS.get(status, Colors.NC)
                 self.log(f"  {color}{status.replace('_', ' ').title()}: {count} ({percentage:.1f}%){Colors.NC}")
         else:
             self.log(f"\n{Colors.YELLOW}No tasks found for this project{Colors.NC}")
 
-        conn.close()
-
     def show_overall_stats(self):
         """Show overall statistics across all projects."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
-        # Project counts
-        cursor.execute('SELECT COUNT(*) FROM projects WHERE status = "active"')
-        active_projects = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(*) FROM projects')
-        total_projects = cursor.fetchone()[0]
-
-        # Task counts
-        cursor.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status')
-        task_counts = dict(cursor.fetchall())
+        # Project and per-status task counts in a single round trip
+        cursor.execute('''
+            SELECT (SELECT COUNT(*) FROM projects WHERE status = 'active'),
+                   (SELECT COUNT(*) FROM projects),
+                   (SELECT COUNT(*) FROM tasks WHERE status = 'pending'),
+                   (SELECT COUNT(*) FROM tasks WHERE status = 'in_progress'),
+                   (SELECT COUNT(*) FROM tasks WHERE status = 'completed'),
+                   (SELECT COUNT(*) FROM tasks WHERE status = 'blocked')
+        ''')
+        active_projects, total_projects, *status_counts = cursor.fetchone()
+        task_counts = dict(zip(('pending', 'in_progress', 'completed', 'blocked'), status_counts))
 
         total_tasks = sum(task_counts.values())
 
@@ -466,82 +586,76 @@ class ProjectTracker:
                 self.log(f"   Progress: [{bar}] {progress:.1%} ({completed}/{total_tasks})")
 
             # Status breakdown
-            status_colors = {
-                'pending': Colors.YELLOW,
-                'in_progress': Colors.BLUE,
-                'completed': Colors.GREEN,
-                'blocked': Colors.RED
-            }
-
             for status, count in task_counts.items():
                 if count > 0:
-                    color = status_colors.get(status, Colors.NC)
+                    color = self.STATUS_COLORS.get(status, Colors.NC)
                     self.log(f"   {color}{status.replace('_', ' ').title()}: {count}{Colors.NC}")
         else:
             self.log("📋 No tasks found")
 
-        conn.close()
-
 def main():
-    tracker = ProjectTracker()
-
-    parser = argparse.ArgumentParser(description='Project Tracker - CLI project and task management')
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Project commands
-    add_project = subparsers.add_parser('add-project', help='Add a new project')
-    add_project.add_argument('name', help='Project name')
-    add_project.add_argument('-p', '--path', help='Project path')
-    add_project.add_argument('-d', '--description', help='Project description')
-
-    list_projects = subparsers.add_parser('projects', help='List all projects')
-    list_projects.add_argument('-s', '--status', help='Filter by status')
-
-    # Task commands
-    add_task = subparsers.add_parser('add', help='Add a new task')
-    add_task.add_argument('project', help='Project ID or name')
-    add_task.add_argument('title', help='Task title')
-    add_task.add_argument('-d', '--description', help='Task description')
-    add_task.add_argument('-p', '--priority', choices=['low', 'medium', 'high'], default='medium')
-    add_task.add_argument('--due', help='Due date (YYYY-MM-DD)')
-
-    list_tasks = subparsers.add_parser('list', help='List tasks')
-    list_tasks.add_argument('-p', '--project', help='Filter by project')
-    list_tasks.add_argument('-s', '--status', help='Filter by status')
-
-    # Status commands
-    complete = subparsers.add_parser('complete', help='Mark task as completed')
-    complete.add_argument('task_id', type=int, help='Task ID')
-
-    start = subparsers.add_parser('start', help='Mark task as in progress')
-    start.add_argument('task_id', type=int, help='Task ID')
-
-    block = subparsers.add_parser('block', help='Mark task as blocked')
-    block.add_argument('task_id', type=int, help='Task ID')
-
-    status = subparsers.add_parser('status', help='Show project status')
-    status.add_argument('project', nargs='?', help='Project ID or name (optional)')
-
-    args = parser.parse_args()
-
-    if args.command == 'add-project':
-        tracker.add_project(args.name, args.path, args.description)
-    elif args.command == 'projects':
-        tracker.list_projects(args.status)
-    elif args.command == 'add':
-        tracker.add_task(args.project, args.title, args.description, args.priority, args.due)
-    elif args.command == 'list':
-        tracker.list_tasks(args.project, args.status)
-    elif args.command == 'complete':
-        tracker.update_task_status(args.task_id, 'completed')
-    elif args.command == 'start':
-        tracker.update_task_status(args.task_id, 'in_progress')
-    elif args.command == 'block':
-        tracker.update_task_status(args.task_id, 'blocked')
-    elif args.command == 'status':
-        tracker.project_status(args.project)
-    else:
-        parser.print_help()
+    # Fast path for 'complete|start|block <id>' that skips building the parser
+    if len(sys.argv) == 3 and sys.argv[1] in STATUS_COMMANDS and sys.argv[2].isdigit():
+        with ProjectTracker() as tracker:
+            tracker.update_task_status(int(sys.argv[2]), STATUS_COMMANDS[sys.argv[1]])
+        return
+
+    import argparse
+
+    with ProjectTracker() as tracker:
+        parser = argparse.ArgumentParser(description='Project Tracker - CLI project and task management')
+        subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+        # Project commands
+        add_project = subparsers.add_parser('add-project', help='Add a new project')
+        add_project.add_argument('name', help='Project name')
+        add_project.add_argument('-p', '--path', help='Project path')
+        add_project.add_argument('-d', '--description', help='Project description')
+
+        list_projects = subparsers.add_parser('projects', help='List all projects')
+        list_projects.add_argument('-s', '--status', help='Filter by status')
+
+        # Task commands
+        add_task = subparsers.add_parser('add', help='Add a new task')
+        add_task.add_argument('project', help='Project ID or name')
+        add_task.add_argument('title', help='Task title')
+        add_task.add_argument('-d', '--description', help='Task description')
+        add_task.add_argument('-p', '--priority', choices=['low', 'medium', 'high'], default='medium')
+        add_task.add_argument('--due', help='Due date (YYYY-MM-DD)')
+
+        list_tasks = subparsers.add_parser('list', help='List tasks')
+        list_tasks.add_argument('-p', '--project', help='Filter by project')
+        list_tasks.add_argument('-s', '--status', help='Filter by status')
+
+        # Status commands
+        complete = subparsers.add_parser('complete', help='Mark task as completed')
+        complete.add_argument('task_id', type=int, help='Task ID')
+
+        start = subparsers.add_parser('start', help='Mark task as in progress')
+        start.add_argument('task_id', type=int, help='Task ID')
+
+        block = subparsers.add_parser('block', help='Mark task as blocked')
+        block.add_argument('task_id', type=int, help='Task ID')
+
+        status = subparsers.add_parser('status', help='Show project status')
+        status.add_argument('project', nargs='?', help='Project ID or name (optional)')
+
+        args = parser.parse_args()
+
+        if args.command == 'add-project':
+            tracker.add_project(args.name, args.path, args.description)
+        elif args.command == 'projects':
+            tracker.list_projects(args.status)
+        elif args.command == 'add':
+            tracker.add_task(args.project, args.title, args.description, args.priority, args.due)
+        elif args.command == 'list':
+            tracker.list_tasks(args.project, args.status)
+        elif args.command in STATUS_COMMANDS:
+            tracker.update_task_status(args.task_id, STATUS_COMMANDS[args.command])
+        elif args.command == 'status':
+            tracker.project_status(args.project)
+        else:
+            parser.print_help()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
+import atexit
+import io
 import os
 import sys
 import sqlite3
 import json
-import argparse
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-import subprocess
+from types import SimpleNamespace
+from typing import List, Dict, Optional, Any, Tuple
 import textwrap
+from collections import deque
 
 # Check if we need to use the virtual environment
 global_venv_python = Path.home() / '.local' / 'share' / 'project-tracker' / 'venv' / 'bin' / 'python'
@@ -21,18 +24,22 @@ if global_venv_python.exists():
 elif project_venv_python.exists():
     venv_python = project_venv_python
 
-# Re-run with virtual environment if needed and available
-if venv_python and sys.executable != str(venv_python):
+# Re-run with virtual environment if needed and available. sys.prefix is the
+# venv directory when running inside it, whichever path the interpreter was
+# started by (resolving the interpreter symlink would land on the base Python);
+# the env marker makes the re-exec strictly one-shot.
+if (venv_python and not os.environ.get('PT_AI_BOOTSTRAPPED')
+        and Path(sys.prefix).resolve() != venv_python.parent.parent.resolve()):
+    os.environ['PT_AI_BOOTSTRAPPED'] = '1'
     os.execv(str(venv_python), [str(venv_python)] + sys.argv)
 
 try:
-    import google.generativeai as genai
+    import orjson  # Optional: faster JSON parsing for AI responses
 except ImportError:
-    print("Error: google-generativeai not installed.")
-    print("The AI features require the Google Generative AI package.")
-    print("It should be installed automatically with the project tracker.")
-    print("If needed, run: pip install --user google-generativeai")
-    sys.exit(1)
+    orjson = None
+
+# Shared wrapper for AI output (textwrap.fill builds a new one per call)
+_WRAP = textwrap.TextWrapper(width=80)
 
 class Colors:
     RED = '\033[0;31m'
@@ -45,25 +52,68 @@ class Colors:
     NC = '\033[0m'
 
 class ProjectTrackerAI:
-    def __init__(self):
+    # Seconds a rendered project context stays valid within one session
+    CONTEXT_TTL = 60
+    # Bump when init_ai_database gains new DDL (stored in PRAGMA user_version)
+    CURRENT_SCHEMA_VERSION = 2
+    # Upper bound on the rendered project context embedded in each prompt
+    MAX_CONTEXT_CHARS = 6000
+
+    # Pre-rendered priority labels for task summaries
+    PRIORITY_LABELS = {
+        'high': f"{Colors.RED}HIGH{Colors.NC}",
+        'medium': f"{Colors.YELLOW}MEDIUM{Colors.NC}",
+        'low': f"{Colors.CYAN}LOW{Colors.NC}"
+    }
+
+    def __init__(self, setup_ai: bool = True):
         self.data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.data_dir / 'tracker.db'
         self.config_path = self.data_dir / 'ai_config.json'
 
+        # One connection for the whole process (an interactive session issues many queries)
+        self._conn = self.connect_database()
+        atexit.register(self._conn.close)
+
+        # project_id -> (monotonic timestamp, rendered context)
+        self._ctx_cache: Dict[int, Tuple[float, str]] = {}
+
         self.init_ai_database()
         self.load_config()
-        self.setup_genai()
+        # Commands that never call the model skip the (slow) genai import
+        if setup_ai:
+            self.setup_genai()
+
+    @staticmethod
+    def colorize(message: str, color: str = Colors.NC) -> str:
+        """Wrap a message in color codes the same way log() prints it."""
+        return f"{color}{message}{Colors.NC}"
 
     def log(self, message: str, color: str = Colors.NC):
         """Print colored log message."""
-        print(f"{color}{message}{Colors.NC}")
+        print(self.colorize(message, color))
 
-    def init_ai_database(self):
-        """Initialize AI-related database tables."""
+    def connect_database(self) -> sqlite3.Connection:
+        """Open and tune the shared database connection."""
         conn = sqlite3.connect(self.db_path)
+        # journal_mode is persistent in the database file, so only switch once
+        if conn.execute('PRAGMA journal_mode').fetchone()[0].lower() != 'wal':
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA busy_timeout=5000')
+        return conn
+
+    def init_ai_database(self):
+        """Initialize AI-related database tables (skipped once the schema is current)."""
+        conn = self._conn
         cursor = conn.cursor()
 
+        if cursor.execute('PRAGMA user_version').fetchone()[0] >= self.CURRENT_SCHEMA_VERSION:
+            return
+
         # AI conversations table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS ai_conversations (
@@ -92,24 +142,41 @@ class ProjectTrackerAI:
             )
         ''')
 
-        # Extend tasks table with AI metadata (with error handling for existing columns)
-        try:
-            cursor.execute('ALTER TABLE tasks ADD COLUMN ai_generated BOOLEAN DEFAULT FALSE')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        try:
-            cursor.execute('ALTER TABLE tasks ADD COLUMN ai_estimate_hours REAL')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # Extend tasks table with AI metadata, only adding columns that are missing
+        existing_columns = {row[1] for row in cursor.execute('PRAGMA table_info(tasks)')}
+        if existing_columns:
+            for column, ddl in (
+                ('ai_generated', 'BOOLEAN DEFAULT FALSE'),
+                ('ai_estimate_hours', 'REAL'),
+                ('ai_complexity', 'TEXT')
+            ):
+                if column not in existing_columns:
+                    cursor.execute(f'ALTER TABLE tasks ADD COLUMN {column} {ddl}')
+
+        # Indexes backing the project context queries
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_ai_conv_pid_conv
+            ON ai_conversations(project_id, conversation_id)
+        ''')
+        for index_sql in (
+            "CREATE INDEX IF NOT EXISTS idx_tasks_pid_updated ON tasks(project_id, updated_at DESC) WHERE status = 'completed'",
+            'CREATE INDEX IF NOT EXISTS idx_git_pid_ts ON git_activity(project_id, timestamp DESC)',
+            'CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name COLLATE NOCASE)',
+            # Redundant with idx_tasks_project_status and idx_git_pid_ts
+            'DROP INDEX IF EXISTS idx_tasks_pid_status_prio',
+            'DROP INDEX IF EXISTS idx_git_activity_project'
+        ):
+            try:
+                cursor.execute(index_sql)
+            except sqlite3.OperationalError:
+                pass  # Core tables not created yet
 
-        try:
-            cursor.execute('ALTER TABLE tasks ADD COLUMN ai_complexity TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # Only record the version once the core tables were there to extend,
+        # otherwise the next run has to finish the job
+        if existing_columns:
+            cursor.execute(f'PRAGMA user_version = {self.CURRENT_SCHEMA_VERSION}')
 
         conn.commit()
-        conn.close()
 
     def load_config(self):
         """Load AI configuration."""
@@ -182,6 +249,16 @@ class ProjectTrackerAI:
             self.log("4. Local config: pt ai config --api-key YOUR_API_KEY", Colors.CYAN)
             return False
 
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            print("Error: google-generativeai not installed.")
+            print("The AI features require the Google Generative AI package.")
+            print("It should be installed automatically with the project tracker.")
+            print("If needed, run: pip install --user google-generativeai")
+            sys.exit(1)
+        self._genai = genai
+
         try:
             genai.configure(api_key=api_key)
             self.model = genai.GenerativeModel(self.config['model'])
@@ -191,18 +268,27 @@ class ProjectTrackerAI:
             return False
 
     def get_project_info(self, project_ref: str) -> Optional[Dict]:
-        """Get project information by ID or name."""
-        conn = sqlite3.connect(self.db_path)
+        """Get project information by ID or name.
+
+        Names are matched exactly first, then as a prefix (both can use the
+        name index), and only then as a substring.
+        """
+        conn = self._conn
         cursor = conn.cursor()
+        columns = 'SELECT id, name, path, description, status FROM projects'
 
         try:
-            project_id = int(project_ref)
-            cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
+            cursor.execute(f'{columns} WHERE id = ?', (int(project_ref),))
+            result = cursor.fetchone()
         except ValueError:
-            cursor.execute('SELECT * FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
-
-        result = cursor.fetchone()
-        conn.close()
+            result = None
+            for clause, param in (('name = ?', project_ref),
+                                  ('name LIKE ?', f'{project_ref}%'),
+                                  ('name LIKE ?', f'%{project_ref}%')):
+                cursor.execute(f'{columns} WHERE {clause} LIMIT 1', (param,))
+                result = cursor.fetchone()
+                if result:
+                    break
 
         if result:
             return {
@@ -215,23 +301,70 @@ class ProjectTrackerAI:
         return None
 
     def get_project_context(self, project_id: int) -> str:
-        """Get comprehensive project context for AI."""
-        conn = sqlite3.connect(self.db_path)
+        """Get comprehensive project context for AI (cached for CONTEXT_TTL seconds)."""
+        cached = self._ctx_cache.get(project_id)
+        if cached and time.monotonic() - cached[0] < self.CONTEXT_TTL:
+            return cached[1]
+
+        data = self._load_project_context(project_id)
+        if not data:
+            return ""
+        context = self._render_context(data)
+        self._ctx_cache[project_id] = (time.monotonic(), context)
+        return context
+
+    def _load_project_context(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Query the database and project tree for the raw AI context."""
+        conn = self._conn
         cursor = conn.cursor()
 
+        # Hold one read snapshot across all four queries (lock taken once, and
+        # the rows are consistent with each other). Skipped if a write is open.
+        own_txn = not conn.in_transaction
+        if own_txn:
+            cursor.execute('BEGIN')
+        try:
+            rows = self._query_project_context(cursor, project_id)
+        finally:
+            if own_txn:
+                conn.commit()
+
+        if not rows:
+            return None
+        (name, path, description, status), active_tasks, completed_tasks, git_activity = rows
+
+        # Add file structure if path exists
+        key_files = []
+        if path and os.path.exists(path):
+            key_files = self._collect_key_files(path)
+
+        return {
+            'name': name,
+            'path': path,
+            'description': description,
+            'status': status,
+            'active_tasks': active_tasks,
+            'completed_tasks': completed_tasks,
+            'git_activity': git_activity,
+            'key_files': key_files
+        }
+
+    @staticmethod
+    def _query_project_context(cursor: sqlite3.Cursor, project_id: int) -> Optional[Tuple]:
+        """Run the project, task and git queries behind the AI context."""
         # Get project details
-        cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
+        cursor.execute('SELECT name, path, description, status FROM projects WHERE id = ?', (project_id,))
         project = cursor.fetchone()
 
         if not project:
-            return ""
+            return None
 
         # Get active tasks
         cursor.execute('''
             SELECT id, title, description, status, priority, due_date
             FROM tasks
             WHERE project_id = ? AND status != 'completed'
-            ORDER BY priority DESC, id ASC
+            ORDER BY CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END, id ASC
         ''', (project_id,))
 
         active_tasks = cursor.fetchall()
@@ -258,66 +391,168 @@ class ProjectTrackerAI:
 
         git_activity = cursor.fetchall()
 
-        conn.close()
-
-        # Build context string
-        context = f"""Project: {project[1]}
-Description: {project[3] or 'No description'}
-Path: {project[2] or 'No path specified'}
-Status: {project[4]}
+        return project, active_tasks, completed_tasks, git_activity
+
+    @classmethod
+    def _render_context(cls, data: Dict[str, Any]) -> str:
+        """Format the raw project context as the text block sent to the model.
+
+        Sections are filled in order of importance (active tasks, Git activity,
+        key files, completed tasks) until MAX_CONTEXT_CHARS is reached; whatever
+        doesn't fit is left out, and the sections keep their usual order.
+        """
+        name_line = f"Project: {data['name']}\n"
+        rest = (f"Path: {data['path'] or 'No path specified'}\n"
+                f"Status: {data['status']}\n\n")
+        # The description is the one free-form header field, so it is cut to
+        # whatever room the rest of the header leaves
+        description = data['description'] or 'No description'
+        room = cls.MAX_CONTEXT_CHARS - len(name_line) - len("Description: \n") - len(rest)
+        if len(description) > room:
+            description = description[:max(room - 1, 0)] + '…'
+        header = f"{name_line}Description: {description}\n{rest}"
+
+        active_entries = []
+        for task in data['active_tasks']:
+            entry = f"- [{task[0]}] {task[1]} (Priority: {task[4]}, Status: {task[3]})"
+            if task[2]:  # description
+                entry += f"\n  Description: {task[2]}"
+            active_entries.append(entry)
+
+        sections = [
+            ("Active Tasks:", active_entries),
+            ("Recently Completed Tasks:", [f"- [{task[0]}] {task[1]}" for task in data['completed_tasks']]),
+            ("Recent Git Activity:", [f"- {activity[0][:8]} on {activity[1]}: {activity[2]}"
+                                      for activity in data['git_activity']]),
+            ("Key Files:", [f"- {rel_path}" for rel_path in data['key_files']])
+        ]
+
+        budget = cls.MAX_CONTEXT_CHARS - len(header)
+        kept = {}
+        for index in (0, 2, 3, 1):
+            heading, entries = sections[index]
+            used = len(heading) + 2  # heading line plus the blank line after it
+            taken = []
+            for entry in entries:
+                if used + len(entry) + 1 > budget:
+                    break
+                used += len(entry) + 1
+                taken.append(entry)
+            if taken:
+                kept[index] = taken
+                budget -= used
+
+        parts = [header]
+        for index, (heading, _) in enumerate(sections):
+            if index in kept:
+                parts.append(heading + "\n" + "\n".join(kept[index]) + "\n\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _collect_key_files(root: str, limit: int = 20,
+                           exts: tuple = ('.py', '.js', '.ts', '.md')) -> List[str]:
+        """Breadth-first scan for source/doc files, stopping after `limit` matches.
+
+        Paths are returned relative to `root`, built up during the walk.
+        """
+        files = []
+        pending = deque([(root, '')])
+        while pending:
+            directory, prefix = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, prefix + entry.name + os.sep))
+                        elif entry.name.endswith(exts) and entry.is_file(follow_symlinks=False):
+                            files.append(prefix + entry.name)
+                            if len(files) >= limit:
+                                return files
+            except OSError:
+                continue  # Unreadable directory
+        return files
+
+    @staticmethod
+    def _write_wrapped(text: str):
+        """Write text to stdout wrapped at 80 columns, keeping its line breaks."""
+        for line in text.split('\n'):
+            sys.stdout.write(_WRAP.fill(line) + '\n')
+        sys.stdout.flush()
+
+    def _generate(self, prompt: str, echo: bool = False, generation_config: Dict = None) -> str:
+        """Stream a completion from the model and return the full text.
+
+        With echo=True every completed line is written to stdout as soon as it
+        arrives, instead of after the whole response has been generated.
+        """
+        parts = []
+        pending = ''
+        for chunk in self.model.generate_content(prompt, stream=True, generation_config=generation_config):
+            parts.append(chunk.text)
+            if echo:
+                pending += chunk.text
+                if '\n' in pending:
+                    complete, pending = pending.rsplit('\n', 1)
+                    self._write_wrapped(complete)
+        if echo and pending:
+            self._write_wrapped(pending)
+        return ''.join(parts)
+
+    @staticmethod
+    def _extract_json(text: str) -> Dict:
+        """Parse the JSON object in a model response, ignoring fences or prose around it."""
+        start = text.find('{')
+        end = text.rfind('}')
+        if start == -1 or end < start:
+            raise json.JSONDecodeError("No JSON object found", text, 0)
+        if orjson:
+            return orjson.loads(text[start:end + 1])
+        return json.loads(text[start:end + 1])
+
+    def _reply(self, text: str, stream: bool) -> str:
+        """Return a chat reply, writing it out first when streaming."""
+        if stream:
+            self._write_wrapped(text)
+        return text
+
+    def chat(self, project_ref: str, message: str, conversation_id: str = None, stream: bool = False,
+             project_info: Optional[Dict] = None) -> str:
+        """Have a conversation with AI about the project.
+
+        With stream=True the reply is written to stdout while it is generated.
+        Callers that already resolved the project pass it as project_info to
+        skip the lookup.
+        """
+        if not hasattr(self, 'model'):
+            return self._reply("AI not configured. Run 'pt ai config --api-key YOUR_API_KEY' first.", stream)
 
-"""
+        project_info = project_info or self.get_project_info(project_ref)
+        if not project_info:
+            return self._reply(f"Project '{project_ref}' not found.", stream)
 
-        if active_tasks:
-            context += "Active Tasks:\n"
-            for task in active_tasks:
-                context += f"- [{task[0]}] {task[1]} (Priority: {task[4]}, Status: {task[3]})\n"
-                if task[2]:  # description
-                    context += f"  Description: {task[2]}\n"
-            context += "\n"
-
-        if completed_tasks:
-            context += "Recently Completed Tasks:\n"
-            for task in completed_tasks:
-                context += f"- [{task[0]}] {task[1]}\n"
-            context += "\n"
-
-        if git_activity:
-            context += "Recent Git Activity:\n"
-            for activity in git_activity:
-                context += f"- {activity[0][:8]} on {activity[1]}: {activity[2]}\n"
-            context += "\n"
+        prompt = (self._chat_prefix(self.get_project_context(project_info['id']))
+                  + f"User's question: {message}")
 
-        # Add file structure if path exists
-        if project[2] and os.path.exists(project[2]):
-            try:
-                result = subprocess.run(['find', project[2], '-type', 'f', '-name', '*.py', '-o', '-name', '*.js', '-o', '-name', '*.ts', '-o', '-name', '*.md'],
-                                      capture_output=True, text=True, timeout=5)
-                if result.stdout:
-                    files = result.stdout.strip().split('\n')[:20]  # Limit to 20 files
-                    context += "Key Files:\n"
-                    for file in files:
-                        rel_path = os.path.relpath(file, project[2])
-                        context += f"- {rel_path}\n"
-                    context += "\n"
-            except:
-                pass
+        try:
+            # Generate conversation ID if not provided
+            if not conversation_id:
+                conversation_id = f"conv_{project_info['id']}_{len(message)}"
 
-        return context
+            response_text = self._generate(prompt, echo=stream)
 
-    def chat(self, project_ref: str, message: str, conversation_id: str = None) -> str:
-        """Have a conversation with AI about the project."""
-        if not hasattr(self, 'model'):
-            return "AI not configured. Run 'pt ai config --api-key YOUR_API_KEY' first."
+            # Store conversation in database
+            self.store_conversation(project_info['id'], conversation_id, 'user', message)
+            self.store_conversation(project_info['id'], conversation_id, 'assistant', response_text)
 
-        project_info = self.get_project_info(project_ref)
-        if not project_info:
-            return f"Project '{project_ref}' not found."
+            return response_text
 
-        project_context = self.get_project_context(project_info['id'])
+        except Exception as e:
+            return self._reply(f"Error communicating with AI: {e}", stream)
 
-        # Create conversation prompt
-        system_prompt = f"""You are an AI assistant for the Project Tracker tool. You help developers manage their projects and code.
+    @staticmethod
+    def _chat_prefix(project_context: str) -> str:
+        """The part of the chat prompt that is the same for every question."""
+        return f"""You are an AI assistant for the Project Tracker tool. You help developers manage their projects and code.
 
 Current Project Context:
 {project_context}
@@ -330,27 +565,15 @@ Instructions:
 - Be concise but thorough
 - Reference existing tasks and files when relevant
 
-User's question: {message}"""
-
-        try:
-            # Generate conversation ID if not provided
-            if not conversation_id:
-                conversation_id = f"conv_{project_info['id']}_{len(message)}"
-
-            response = self.model.generate_content(system_prompt)
-
-            # Store conversation in database
-            self.store_conversation(project_info['id'], conversation_id, 'user', message)
-            self.store_conversation(project_info['id'], conversation_id, 'assistant', response.text)
+"""
 
-            return response.text
-
-        except Exception as e:
-            return f"Error communicating with AI: {e}"
+    def invalidate_context(self, project_id: int):
+        """Forget cached context for a project after its tasks changed."""
+        self._ctx_cache.pop(project_id, None)
 
     def store_conversation(self, project_id: int, conversation_id: str, role: str, content: str):
         """Store conversation in database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -359,7 +582,6 @@ User's question: {message}"""
         ''', (project_id, conversation_id, role, content))
 
         conn.commit()
-        conn.close()
 
     def create_task_from_nl(self, project_ref: str, description: str) -> bool:
         """Create a task from natural language description using AI."""
@@ -394,70 +616,74 @@ Please respond with a JSON object containing:
 Only respond with the JSON object, no other text."""
 
         try:
-            response = self.model.generate_content(prompt)
-            task_data = json.loads(response.text.strip())
-
-            # Create the main task
-            conn = sqlite3.connect(self.db_path)
+            json_config = {'response_mime_type': 'application/json'}
+            try:
+                task_data = self._extract_json(self._generate(prompt, generation_config=json_config))
+            except json.JSONDecodeError:
+                self.log("⚠ AI response was not valid JSON. Trying again...", Colors.YELLOW)
+                prompt += "\n\nIMPORTANT: Reply with the raw JSON object only - no markdown fences, no commentary."
+                task_data = self._extract_json(self._generate(prompt, generation_config=json_config))
+
+            # Create the main task, its subtasks and the project timestamp in one transaction
+            conn = self._conn
             cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO tasks (project_id, title, description, priority, ai_generated, ai_estimate_hours, ai_complexity)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                project_info['id'],
-                task_data['title'],
-                task_data['description'],
-                task_data['priority'],
-                True,
-                task_data.get('estimated_hours'),
-                task_data.get('complexity')
-            ))
-
-            task_id = cursor.lastrowid
-
-            # Update project timestamp
-            cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_info['id'],))
-
-            conn.commit()
-            conn.close()
-
-            # Display created task
-            priority_color = {
-                'high': Colors.RED,
-                'medium': Colors.YELLOW,
-                'low': Colors.CYAN
-            }.get(task_data['priority'], Colors.NC)
-
-            self.log(f"✓ Created AI task '{task_data['title']}' (ID: {task_id})", Colors.GREEN)
-            self.log(f"  Priority: {priority_color}{task_data['priority'].upper()}{Colors.NC}")
-            if task_data.get('estimated_hours'):
-                self.log(f"  Estimated: {task_data['estimated_hours']} hours")
-            if task_data.get('complexity'):
-                self.log(f"  Complexity: {task_data['complexity']}")
-
-            # Create subtasks if any
-            if 'subtasks' in task_data and task_data['subtasks']:
-                self.log(f"  Creating {len(task_data['subtasks'])} subtasks...", Colors.CYAN)
-                for i, subtask in enumerate(task_data['subtasks'], 1):
-                    cursor.execute('''
+            subtasks = task_data.get('subtasks') or []
+
+            with conn:
+                cursor.execute('''
+                    INSERT INTO tasks (project_id, title, description, priority, ai_generated, ai_estimate_hours, ai_complexity)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    project_info['id'],
+                    task_data['title'],
+                    task_data['description'],
+                    task_data['priority'],
+                    True,
+                    task_data.get('estimated_hours'),
+                    task_data.get('complexity')
+                ))
+
+                task_id = cursor.lastrowid
+
+                if subtasks:
+                    cursor.executemany('''
                         INSERT INTO tasks (project_id, title, description, priority, ai_generated)
                         VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        project_info['id'],
-                        f"{task_data['title']} - {subtask}",
-                        f"Subtask {i} of main task [{task_id}]: {subtask}",
-                        'medium',
-                        True
-                    ))
-
-                conn.commit()
-                conn.close()
+                    ''', [
+                        (
+                            project_info['id'],
+                            f"{task_data['title']} - {subtask}",
+                            f"Subtask {i} of main task [{task_id}]: {subtask}",
+                            'medium',
+                            True
+                        )
+                        for i, subtask in enumerate(subtasks, 1)
+                    ])
+
+                # Update project timestamp
+                cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (project_info['id'],))
+
+            self.invalidate_context(project_info['id'])
+
+            # Display created task in a single write
+            priority = task_data['priority']
+            label = self.PRIORITY_LABELS.get(priority) or priority.upper()
+            buf = io.StringIO()
+            created = f"✓ Created AI task '{task_data['title']}' (ID: {task_id})"
+            buf.write(self.colorize(created, Colors.GREEN) + "\n")
+            buf.write(f"  Priority: {label}\n")
+            if task_data.get('estimated_hours'):
+                buf.write(f"  Estimated: {task_data['estimated_hours']} hours\n")
+            if task_data.get('complexity'):
+                buf.write(f"  Complexity: {task_data['complexity']}\n")
+            if subtasks:
+                buf.write(self.colorize(f"  Created {len(subtasks)} subtasks", Colors.CYAN) + "\n")
+            sys.stdout.write(buf.getvalue())
 
             return True
 
         except json.JSONDecodeError:
-            self.log("✗ AI response was not valid JSON. Trying again...", Colors.RED)
+            self.log("✗ AI response was not valid JSON.", Colors.RED)
             return False
         except Exception as e:
             self.log(f"✗ Error creating task: {e}", Colors.RED)
@@ -469,15 +695,14 @@ Only respond with the JSON object, no other text."""
             self.log("AI not configured.", Colors.RED)
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
 
         # Get task details
         cursor.execute('''
-            SELECT t.*, p.name, p.path, p.description
-            FROM tasks t
-            JOIN projects p ON t.project_id = p.id
-            WHERE t.id = ?
+            SELECT id, project_id, title, description, status, priority
+            FROM tasks
+            WHERE id = ?
         ''', (task_id,))
 
         task = cursor.fetchone()
@@ -485,7 +710,8 @@ Only respond with the JSON object, no other text."""
             self.log(f"Task {task_id} not found.", Colors.RED)
             return
 
-        project_context = self.get_project_context(task[1])  # project_id
+        _, project_id, title, description, status, priority = task
+        project_context = self.get_project_context(project_id)
 
         # AI analysis prompt
         prompt = f"""Analyze this task within the project context and provide insights.
@@ -494,11 +720,11 @@ Project Context:
 {project_context}
 
 Task Details:
-- ID: {task[0]}
-- Title: {task[2]}
-- Description: {task[3]}
-- Status: {task[4]}
-- Priority: {task[5]}
+- ID: {task_id}
+- Title: {title}
+- Description: {description}
+- Status: {status}
+- Priority: {priority}
 
 Please provide:
 1. Implementation approach recommendations
@@ -511,28 +737,22 @@ Please provide:
 Keep the response practical and actionable."""
 
         try:
-            response = self.model.generate_content(prompt)
+            sys.stdout.write(self.colorize(f"🧠 AI Analysis for Task [{task_id}]: {title}", Colors.BLUE)
+                             + f"\n{'=' * 60}\n")
 
-            self.log(f"{Colors.BLUE}🧠 AI Analysis for Task [{task_id}]: {task[2]}{Colors.NC}")
-            self.log("=" * 60)
-
-            # Format and display the response
-            formatted_response = textwrap.fill(response.text, width=80,
-                                             initial_indent="", subsequent_indent="")
-            print(formatted_response)
+            # Display the response while it streams in
+            response_text = self._generate(prompt, echo=True)
 
             # Store insight in database
             cursor.execute('''
                 INSERT INTO ai_insights (project_id, task_id, insight_type, content)
                 VALUES (?, ?, ?, ?)
-            ''', (task[1], task_id, 'analysis', response.text))
+            ''', (project_id, task_id, 'analysis', response_text))
 
             conn.commit()
 
         except Exception as e:
             self.log(f"Error analyzing task: {e}", Colors.RED)
-        finally:
-            conn.close()
 
     def configure(self, api_key: str = None):
         """Configure AI settings."""
@@ -574,42 +794,61 @@ Keep the response practical and actionable."""
             if current_key:
                 self.log(f"  API Key: ***...{current_key[-4:]} (secured)", Colors.GREEN)
 
+# Model commands taking only positionals: command -> argument names
+FAST_COMMANDS = {
+    'chat': ('project', 'message'),
+    'add': ('project', 'description'),
+    'analyze': ('task_id',),
+    'interactive': ('project',)
+}
+
 def main():
-    ai = ProjectTrackerAI()
+    # Fast path for the plain positional forms that skips building the parser
+    argv = sys.argv[1:]
+    fields = FAST_COMMANDS.get(argv[0]) if argv else None
+    if (fields and len(argv) == len(fields) + 1
+            and not any(arg.startswith('-') for arg in argv[1:])
+            and (argv[0] != 'analyze' or argv[1].isdigit())):
+        args = SimpleNamespace(command=argv[0], **dict(zip(fields, argv[1:])))
+        if args.command == 'analyze':
+            args.task_id = int(args.task_id)
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(description='Project Tracker AI - Intelligent project management')
+        subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
-    parser = argparse.ArgumentParser(description='Project Tracker AI - Intelligent project management')
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+        # Configuration
+        config_cmd = subparsers.add_parser('config', help='Configure AI settings')
+        config_cmd.add_argument('--api-key', help='Set Google AI API key')
 
-    # Configuration
-    config_cmd = subparsers.add_parser('config', help='Configure AI settings')
-    config_cmd.add_argument('--api-key', help='Set Google AI API key')
+        # Chat
+        chat_cmd = subparsers.add_parser('chat', help='Chat with AI about a project')
+        chat_cmd.add_argument('project', help='Project ID or name')
+        chat_cmd.add_argument('message', help='Your message to the AI')
 
-    # Chat
-    chat_cmd = subparsers.add_parser('chat', help='Chat with AI about a project')
-    chat_cmd.add_argument('project', help='Project ID or name')
-    chat_cmd.add_argument('message', help='Your message to the AI')
+        # Task creation
+        add_cmd = subparsers.add_parser('add', help='Create task from natural language')
+        add_cmd.add_argument('project', help='Project ID or name')
+        add_cmd.add_argument('description', help='Natural language task description')
 
-    # Task creation
-    add_cmd = subparsers.add_parser('add', help='Create task from natural language')
-    add_cmd.add_argument('project', help='Project ID or name')
-    add_cmd.add_argument('description', help='Natural language task description')
+        # Task analysis
+        analyze_cmd = subparsers.add_parser('analyze', help='Analyze a task with AI')
+        analyze_cmd.add_argument('task_id', type=int, help='Task ID to analyze')
 
-    # Task analysis
-    analyze_cmd = subparsers.add_parser('analyze', help='Analyze a task with AI')
-    analyze_cmd.add_argument('task_id', type=int, help='Task ID to analyze')
+        # Interactive chat
+        interactive_cmd = subparsers.add_parser('interactive', help='Start interactive chat session')
+        interactive_cmd.add_argument('project', help='Project ID or name')
 
-    # Interactive chat
-    interactive_cmd = subparsers.add_parser('interactive', help='Start interactive chat session')
-    interactive_cmd.add_argument('project', help='Project ID or name')
+        args = parser.parse_args()
 
-    args = parser.parse_args()
+    ai = ProjectTrackerAI(setup_ai=args.command in FAST_COMMANDS)
 
     if args.command == 'config':
         ai.configure(args.api_key)
     elif args.command == 'chat':
-        response = ai.chat(args.project, args.message)
         ai.log(f"{Colors.BLUE}🤖 AI Response:{Colors.NC}")
-        print(textwrap.fill(response, width=80))
+        ai.chat(args.project, args.message, stream=True)
     elif args.command == 'add':
         ai.create_task_from_nl(args.project, args.description)
     elif args.command == 'analyze':
@@ -631,9 +870,8 @@ def main():
                     ai.log("👋 Goodbye!", Colors.GREEN)
                     break
 
-                response = ai.chat(args.project, user_input)
                 ai.log(f"{Colors.BLUE}🤖 AI:{Colors.NC}")
-                print(textwrap.fill(response, width=80, initial_indent="", subsequent_indent=""))
+                ai.chat(args.project, user_input, stream=True, project_info=project_info)
 
             except KeyboardInterrupt:
                 ai.log("\n👋 Goodbye!", Colors.GREEN)
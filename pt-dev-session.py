@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import atexit
+import functools
+import shutil
 import sqlite3
 import subprocess
 import sys
@@ -8,11 +11,22 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 
+CPU_GOVERNOR_PATH = Path('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor')
+
 def get_project_tracker_db():
     """Get path to project tracker database."""
     data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
     return data_dir / 'tracker.db'
 
+@functools.lru_cache(maxsize=1)
+def get_connection():
+    """Open the tracker database once per process and reuse the connection."""
+    conn = sqlite3.connect(get_project_tracker_db())
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    atexit.register(conn.close)
+    return conn
+
 class Colors:
     RED = '\033[0;31m'
     GREEN = '\033[0;32m'
@@ -26,23 +40,43 @@ def log(message, color=Colors.NC):
     """Print colored log message."""
     print(f"{color}{message}{Colors.NC}")
 
+def run_command(args, check=False):
+    """Run a helper command via posix_spawn rather than fork+exec.
+
+    subprocess only takes the posix_spawn path for an executable given with a
+    directory and without close_fds (our own descriptors are non-inheritable
+    anyway), so resolve it on PATH first.
+    """
+    executable = shutil.which(args[0])
+    if executable is None:
+        raise FileNotFoundError(f"{args[0]}: command not found")
+    return subprocess.run([executable, *args[1:]], check=check, close_fds=False)
+
 def get_project_info(project_ref):
-    """Get project information by ID or name."""
+    """Get project information by ID or name.
+
+    Names are matched exactly first, then as a prefix (both can use the name
+    index), and only then as a substring.
+    """
     db_path = get_project_tracker_db()
     if not db_path.exists():
         return None
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
+    columns = 'SELECT id, name, path, description, status FROM projects'
 
     try:
-        project_id = int(project_ref)
-        cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
+        cursor.execute(f'{columns} WHERE id = ?', (int(project_ref),))
+        result = cursor.fetchone()
     except ValueError:
-        cursor.execute('SELECT * FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
-
-    result = cursor.fetchone()
-    conn.close()
+        result = None
+        for clause, param in (('name = ?', project_ref),
+                              ('name LIKE ?', f'{project_ref}%'),
+                              ('name LIKE ?', f'%{project_ref}%')):
+            cursor.execute(f'{columns} WHERE {clause} LIMIT 1', (param,))
+            result = cursor.fetchone()
+            if result:
+                break
 
     if result:
         return {
@@ -56,20 +90,16 @@ def get_project_info(project_ref):
 
 def get_active_tasks(project_id):
     """Get active tasks for the project."""
-    db_path = get_project_tracker_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute('''
         SELECT id, title, status, priority
         FROM tasks
         WHERE project_id = ? AND status != 'completed'
-        ORDER BY priority DESC, id ASC
+        ORDER BY CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END, id ASC
     ''', (project_id,))
 
-    tasks = cursor.fetchall()
-    conn.close()
-    return tasks
+    return cursor.fetchall()
 
 def optimize_system_for_development(project_type):
     """Optimize system performance for development work."""
@@ -77,24 +107,22 @@ def optimize_system_for_development(project_type):
 
     # Set CPU governor to performance
     try:
-        current_governor = subprocess.check_output(
-            ['cat', '/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor']
-        ).decode().strip()
+        current_governor = CPU_GOVERNOR_PATH.read_text().strip()
 
         if current_governor != 'performance':
             log(f"   CPU Governor: {current_governor} -> performance")
             # Use your existing gaming-performance.sh script for CPU optimization
-            subprocess.run(['gaming-performance.sh', 'performance'], check=False)
+            run_command(['gaming-performance.sh', 'performance'])
         else:
             log("   ✓ CPU Governor: Already in performance mode", Colors.GREEN)
-    except:
+    except OSError:
         log("   ⚠ Could not check CPU governor", Colors.YELLOW)
 
     # NVIDIA optimizations for TypeScript/heavy development
     if project_type in ['typescript', 'javascript'] or 'heavy' in project_type.lower():
         try:
             log("   Enabling NVIDIA performance for development workload...")
-            subprocess.run(['nvidia-gaming-performance.sh', 'performance'], check=False)
+            run_command(['nvidia-gaming-performance.sh', 'performance'])
         except:
             log("   ⚠ NVIDIA performance script not available", Colors.YELLOW)
 
@@ -121,13 +149,23 @@ def start_development_session(project_info, task_id=None):
 
         # Show Git status
         try:
-            os.chdir(project_path)
-            branch = subprocess.check_output(['git', 'branch', '--show-current']).decode().strip()
-            status = subprocess.check_output(['git', 'status', '--porcelain']).decode().strip()
+            # Branch and working tree changes from a single git call
+            output = subprocess.check_output(['git', '-C', project_path, 'status',
+                                              '--porcelain=v2', '--branch'],
+                                             text=True, stderr=subprocess.DEVNULL)
+            branch = ''
+            changes = 0
+            for line in output.splitlines():
+                if line.startswith('# branch.head '):
+                    branch = line[len('# branch.head '):]
+                elif not line.startswith('#'):
+                    changes += 1
+            if branch == '(detached)':
+                branch = ''
 
             log(f"🌿 Git: {branch}")
-            if status:
-                log(f"   {Colors.YELLOW}⚠ {len(status.splitlines())} uncommitted changes{Colors.NC}")
+            if changes:
+                log(f"   {Colors.YELLOW}⚠ {changes} uncommitted changes{Colors.NC}")
             else:
                 log(f"   {Colors.GREEN}✓ Working directory clean{Colors.NC}")
         except:
@@ -150,7 +188,7 @@ def start_development_session(project_info, task_id=None):
         if task_id:
             # Mark specific task as in progress
             try:
-                subprocess.run(['pt', 'start', str(task_id)], check=True)
+                run_command(['pt', 'start', str(task_id)], check=True)
                 log(f"\n✓ Marked task {task_id} as in progress", Colors.GREEN)
             except:
                 log(f"\n✗ Could not start task {task_id}", Colors.RED)
@@ -170,19 +208,27 @@ def start_development_session(project_info, task_id=None):
         log("   • Python: pip install -e . for development install")
         log("   • Run tests with pytest before completing tasks")
 
+def list_dir_names(path):
+    """Names in a directory from one listing, instead of a stat() per marker file."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def detect_project_type(project_path):
     """Detect the type of project."""
-    path = Path(project_path)
+    names = list_dir_names(project_path)
 
-    if (path / 'package.json').exists():
-        if (path / 'tsconfig.json').exists():
+    if 'package.json' in names:
+        if 'tsconfig.json' in names:
             return 'typescript'
         return 'javascript'
-    elif (path / 'pyproject.toml').exists() or (path / 'setup.py').exists():
+    elif 'pyproject.toml' in names or 'setup.py' in names:
         return 'python'
-    elif (path / 'Cargo.toml').exists():
+    elif 'Cargo.toml' in names:
         return 'rust'
-    elif (path / 'go.mod').exists():
+    elif 'go.mod' in names:
         return 'go'
     else:
         return 'general'
@@ -193,8 +239,8 @@ def end_development_session():
 
     # Restore balanced performance
     try:
-        subprocess.run(['gaming-performance.sh', 'balanced'], check=False)
-        subprocess.run(['nvidia-gaming-performance.sh', 'balanced'], check=False)
+        run_command(['gaming-performance.sh', 'balanced'])
+        run_command(['nvidia-gaming-performance.sh', 'balanced'])
         log("✓ System performance restored to balanced mode", Colors.GREEN)
     except:
         log("⚠ Could not restore balanced performance settings", Colors.YELLOW)
@@ -236,26 +282,24 @@ def main():
 
         # CPU Governor
         try:
-            governor = subprocess.check_output(
-                ['cat', '/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor']
-            ).decode().strip()
+            governor = CPU_GOVERNOR_PATH.read_text().strip()
 
             if governor == 'performance':
                 log(f"⚡ CPU: {Colors.GREEN}Performance Mode{Colors.NC}")
             else:
                 log(f"⚡ CPU: {Colors.YELLOW}{governor.title()} Mode{Colors.NC}")
-        except:
+        except OSError:
             log("⚡ CPU: Unknown status")
 
         # NVIDIA Status (if available)
         try:
-            subprocess.run(['nvidia-gaming-performance.sh', 'status'], check=False)
+            run_command(['nvidia-gaming-performance.sh', 'status'])
         except:
             pass
 
         # Overall project status
         log(f"\n{Colors.CYAN}📊 Project Tracking Overview:{Colors.NC}")
-        subprocess.run(['pt', 'status'], check=False)
+        run_command(['pt', 'status'])
 
     else:
         parser.print_help()
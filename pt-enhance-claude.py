@@ -1,84 +1,136 @@
 #!/usr/bin/env python3
 
+import atexit
+import functools
+import itertools
 import sqlite3
 import os
+import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 import json
 
+try:
+    import orjson  # Optional: faster package.json parsing
+except ImportError:
+    orjson = None
+
 def get_project_tracker_db():
     """Get path to project tracker database."""
     data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
     return data_dir / 'tracker.db'
 
+@functools.lru_cache(maxsize=1)
+def get_connection():
+    """Open the tracker database once per process and reuse the connection."""
+    conn = sqlite3.connect(get_project_tracker_db())
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    atexit.register(conn.close)
+    return conn
+
+# Template placeholders look like [PROJECT_ID]
+PLACEHOLDER_PATTERN = re.compile(r'\[([A-Z_]+)\]')
+
+def get_template_path():
+    """Get path to the CLAUDE.md template."""
+    return Path.home() / '.local' / 'bin' / 'pt-claude-template.md'
+
+@functools.lru_cache(maxsize=1)
 def get_template_content():
     """Get the CLAUDE.md template content."""
-    template_path = Path.home() / '.local' / 'bin' / 'pt-claude-template.md'
-    with open(template_path, 'r') as f:
+    with open(get_template_path(), 'r') as f:
         return f.read()
 
 def get_active_tasks(project_id):
     """Get active tasks for a project formatted for CLAUDE.md."""
-    db_path = get_project_tracker_db()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute('''
         SELECT id, title, description, status, priority
         FROM tasks
         WHERE project_id = ? AND status != 'completed'
-        ORDER BY priority DESC, id ASC
+        ORDER BY CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END, id ASC
     ''', (project_id,))
 
-    tasks = cursor.fetchall()
-    conn.close()
+    return format_tasks(cursor.fetchall())
 
+def get_active_tasks_for_all_projects():
+    """Get formatted active tasks for every project with a path, in one query."""
+    cursor = get_connection().cursor()
+
+    cursor.execute('''
+        SELECT project_id, id, title, description, status, priority
+        FROM tasks
+        WHERE status != 'completed'
+          AND project_id IN (SELECT id FROM projects WHERE path IS NOT NULL)
+        ORDER BY project_id, CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1 ELSE 2 END, id ASC
+    ''')
+
+    return {
+        project_id: format_tasks([row[1:] for row in rows])
+        for project_id, rows in itertools.groupby(cursor.fetchall(), key=lambda row: row[0])
+    }
+
+# Task markers used in the CLAUDE.md task list
+PRIORITY_SYMBOLS = {'high': '🔥', 'medium': '⚡', 'low': '📝'}
+STATUS_SYMBOLS = {'pending': '⏸️', 'in_progress': '🔄', 'blocked': '🚫'}
+
+def format_tasks(tasks):
+    """Format (id, title, description, status, priority) rows for CLAUDE.md."""
     if not tasks:
         return "No active tasks"
 
-    task_list = []
-    priority_symbols = {'high': '🔥', 'medium': '⚡', 'low': '📝'}
-    status_symbols = {'pending': '⏸️', 'in_progress': '🔄', 'blocked': '🚫'}
-
-    for tid, title, desc, status, priority in tasks:
-        priority_symbol = priority_symbols.get(priority, '📝')
-        status_symbol = status_symbols.get(status, '⏸️')
+    return '\n'.join(
+        f"- {STATUS_SYMBOLS.get(status, '⏸️')} **[{tid}]** {PRIORITY_SYMBOLS.get(priority, '📝')} {title}"
+        + (f"\n  - {desc}" if desc else '')
+        for tid, title, desc, status, priority in tasks
+    )
 
-        task_item = f"- {status_symbol} **[{tid}]** {priority_symbol} {title}"
-        if desc:
-            task_item += f"\n  - {desc}"
-
-        task_list.append(task_item)
+def list_dir_names(path):
+    """Names in a directory from one listing, instead of a stat() per marker file."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def uses_typescript(package_json_path):
+    """Check whether package.json lists typescript as a (dev) dependency."""
+    data = package_json_path.read_bytes()
+    # Without the quoted name anywhere there is nothing to parse for
+    if b'"typescript"' not in data:
+        return False
 
-    return '\n'.join(task_list)
+    package_data = orjson.loads(data) if orjson else json.loads(data)
+    return ('typescript' in package_data.get('dependencies', {})
+            or 'typescript' in package_data.get('devDependencies', {}))
 
 def detect_project_type(project_path):
     """Detect project type and return appropriate configuration."""
     path = Path(project_path)
+    names = list_dir_names(project_path)
 
     # Check for various project indicators
-    if (path / 'package.json').exists():
-        with open(path / 'package.json') as f:
-            package_data = json.load(f)
-            dependencies = {**package_data.get('dependencies', {}),
-                          **package_data.get('devDependencies', {})}
-
-            if 'typescript' in dependencies or (path / 'tsconfig.json').exists():
-                return {
-                    'agent_type': 'typescript',
-                    'tech_stack': 'TypeScript/Node.js',
-                    'commands': 'npm install, npm run build, npm test',
-                    'agent_capabilities': 'TypeScript compilation, Node.js modules, package management'
-                }
-            else:
-                return {
-                    'agent_type': 'javascript',
-                    'tech_stack': 'JavaScript/Node.js',
-                    'commands': 'npm install, npm run build, npm test',
-                    'agent_capabilities': 'JavaScript modules, Node.js runtime, package management'
-                }
-
-    elif (path / 'pyproject.toml').exists() or (path / 'setup.py').exists():
+    if 'package.json' in names:
+        if 'tsconfig.json' in names or uses_typescript(path / 'package.json'):
+            return {
+                'agent_type': 'typescript',
+                'tech_stack': 'TypeScript/Node.js',
+                'commands': 'npm install, npm run build, npm test',
+                'agent_capabilities': 'TypeScript compilation, Node.js modules, package management'
+            }
+        else:
+            return {
+                'agent_type': 'javascript',
+                'tech_stack': 'JavaScript/Node.js',
+                'commands': 'npm install, npm run build, npm test',
+                'agent_capabilities': 'JavaScript modules, Node.js runtime, package management'
+            }
+
+    elif 'pyproject.toml' in names or 'setup.py' in names:
         return {
             'agent_type': 'python',
             'tech_stack': 'Python',
@@ -86,7 +138,7 @@ def detect_project_type(project_path):
             'agent_capabilities': 'Python packages, testing frameworks, code quality tools'
         }
 
-    elif (path / 'Cargo.toml').exists():
+    elif 'Cargo.toml' in names:
         return {
             'agent_type': 'rust',
             'tech_stack': 'Rust',
@@ -102,42 +154,44 @@ def detect_project_type(project_path):
             'agent_capabilities': 'General file operations and code analysis'
         }
 
-def generate_claude_md(project_id, project_name, project_path, description):
-    """Generate enhanced CLAUDE.md content."""
+def generate_claude_md(project_id, project_name, project_path, description, tasks_text=None):
+    """Generate enhanced CLAUDE.md content.
+
+    tasks_text is the pre-formatted task list when the caller already batched it.
+    """
     template = get_template_content()
-    active_tasks = get_active_tasks(project_id)
+    active_tasks = tasks_text if tasks_text is not None else get_active_tasks(project_id)
     project_config = detect_project_type(project_path)
 
-    # Replace template placeholders
-    content = template.replace('[PROJECT_ID]', str(project_id))
-    content = content.replace('[PROJECT_STATUS]', 'Active')
-    content = content.replace('[PROJECT_PRIORITY]', 'Medium')
-    content = content.replace('[ACTIVE_TASKS_PLACEHOLDER]', active_tasks)
-    content = content.replace('[TECH_STACK_DESCRIPTION]', project_config['tech_stack'])
-    content = content.replace('[PROJECT_COMMANDS]', project_config['commands'])
-    content = content.replace('[AGENT_TYPE]', project_config['agent_type'])
-    content = content.replace('[AGENT_CAPABILITIES]', project_config['agent_capabilities'])
-
-    # Add project-specific content
-    content = content.replace('[DEVELOPMENT_WORKFLOW]',
-        f"Standard {project_config['tech_stack']} development workflow with Git integration and project tracking.")
-
-    content = content.replace('[PERFORMANCE_NOTES]',
-        f"Project is tracked via pt:{project_id}. Use Git commit messages with task references for automatic updates.")
-
-    content = content.replace('[FILE_STRUCTURE_OVERVIEW]',
-        f"Standard {project_config['tech_stack']} project structure. See README.md for details.")
-
-    content = content.replace('[TESTING_APPROACH]',
-        f"Follow {project_config['tech_stack']} testing best practices. Run tests before marking tasks as completed.")
-
-    content = content.replace('[DEPLOYMENT_INFO]',
-        "See project documentation for deployment procedures.")
-
-    content = content.replace('[CUSTOM_GUIDELINES]',
-        f"- This project is tracked with pt:{project_id}\n- Use task references in Git commits\n- Update project tracker when completing milestones")
-
-    return content
+    # Replace template placeholders in a single pass
+    tech_stack = project_config['tech_stack']
+    replacements = {
+        'PROJECT_ID': str(project_id),
+        'PROJECT_STATUS': 'Active',
+        'PROJECT_PRIORITY': 'Medium',
+        'ACTIVE_TASKS_PLACEHOLDER': active_tasks,
+        'TECH_STACK_DESCRIPTION': tech_stack,
+        'PROJECT_COMMANDS': project_config['commands'],
+        'AGENT_TYPE': project_config['agent_type'],
+        'AGENT_CAPABILITIES': project_config['agent_capabilities'],
+
+        # Project-specific content
+        'DEVELOPMENT_WORKFLOW':
+            f"Standard {tech_stack} development workflow with Git integration and project tracking.",
+        'PERFORMANCE_NOTES':
+            f"Project is tracked via pt:{project_id}. Use Git commit messages with task references for automatic updates.",
+        'FILE_STRUCTURE_OVERVIEW':
+            f"Standard {tech_stack} project structure. See README.md for details.",
+        'TESTING_APPROACH':
+            f"Follow {tech_stack} testing best practices. Run tests before marking tasks as completed.",
+        'DEPLOYMENT_INFO':
+            "See project documentation for deployment procedures.",
+        'CUSTOM_GUIDELINES':
+            f"- This project is tracked with pt:{project_id}\n- Use task references in Git commits\n- Update project tracker when completing milestones"
+    }
+
+    # Unknown placeholders (like the [TASK_ID] examples) are left as they are
+    return PLACEHOLDER_PATTERN.sub(lambda match: replacements.get(match.group(1), match.group(0)), template)
 
 def main():
     """Main function to enhance CLAUDE.md files."""
@@ -153,35 +207,75 @@ def main():
         print("✗ Project tracker database not found")
         sys.exit(1)
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     if sys.argv[1] == '--all':
-        # Process all projects
-        cursor.execute('SELECT id, name, path, description FROM projects WHERE path IS NOT NULL')
+        # Process all projects, with the (UTC epoch) time of their latest
+        # project or task change
+        cursor.execute('''
+            SELECT p.id, p.name, p.path, p.description,
+                   CAST(strftime('%s', MAX(p.updated_at, COALESCE(
+                       (SELECT MAX(t.updated_at) FROM tasks t WHERE t.project_id = p.id),
+                       p.updated_at))) AS INTEGER)
+            FROM projects p
+            WHERE p.path IS NOT NULL
+        ''')
         projects = cursor.fetchall()
 
         if not projects:
             print("✗ No projects with paths found")
             sys.exit(1)
 
+        tasks_by_project = get_active_tasks_for_all_projects()
+        try:
+            template_mtime = get_template_path().stat().st_mtime
+        except OSError:
+            template_mtime = None  # process_project reports the missing template
+
+        def enhance(project):
+            pid, name, path, desc, changed_at = project
+            messages = []
+            # Database timestamps have one-second resolution, so only trust
+            # a file written in a later second
+            if changed_at is not None and template_mtime is not None:
+                changed_at = max(changed_at + 1, template_mtime)
+            else:
+                changed_at = None
+            success = process_project(pid, name, path, desc, backup,
+                                      tasks_by_project.get(pid, "No active tasks"), messages.append,
+                                      changed_at)
+            return success, messages
+
+        # Projects are independent file IO; messages are printed in project order
+        from concurrent.futures import ThreadPoolExecutor
+
         success_count = 0
-        for pid, name, path, desc in projects:
-            if process_project(pid, name, path, desc, backup):
-                success_count += 1
+        with ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+            for success, messages in executor.map(enhance, projects):
+                for message in messages:
+                    print(message)
+                success_count += success
 
         print(f"\n✓ Enhanced CLAUDE.md for {success_count}/{len(projects)} projects")
 
     else:
         # Process specific project
         project_ref = sys.argv[1]
+        columns = 'SELECT id, name, path, description FROM projects'
         try:
-            project_id = int(project_ref)
-            cursor.execute('SELECT id, name, path, description FROM projects WHERE id = ?', (project_id,))
+            cursor.execute(f'{columns} WHERE id = ?', (int(project_ref),))
+            result = cursor.fetchone()
         except ValueError:
-            cursor.execute('SELECT id, name, path, description FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
+            # Exact, then prefix (both indexed), then substring as a last resort
+            result = None
+            for clause, param in (('name = ?', project_ref),
+                                  ('name LIKE ?', f'{project_ref}%'),
+                                  ('name LIKE ?', f'%{project_ref}%')):
+                cursor.execute(f'{columns} WHERE {clause} LIMIT 1', (param,))
+                result = cursor.fetchone()
+                if result:
+                    break
 
-        result = cursor.fetchone()
         if not result:
             print(f"✗ Project '{project_ref}' not found")
             sys.exit(1)
@@ -190,36 +284,80 @@ def main():
         if process_project(pid, name, path, desc, backup):
             print("✓ CLAUDE.md enhanced successfully")
 
-    conn.close()
+def process_project(project_id, name, path, description, backup, tasks_text=None, report=print,
+                    changed_at=None):
+    """Process a single project, passing status messages to report.
 
-def process_project(project_id, name, path, description, backup):
-    """Process a single project."""
+    changed_at is the epoch time of the project's latest change; a CLAUDE.md
+    last written at or after it is left alone without regenerating it.
+    """
     if not path or not os.path.exists(path):
-        print(f"✗ {name} - Path '{path}' does not exist")
+        report(f"✗ {name} - Path '{path}' does not exist")
         return False
 
     claude_md_path = Path(path) / 'CLAUDE.md'
 
     try:
-        # Backup existing file if requested
-        if backup and claude_md_path.exists():
-            backup_path = claude_md_path.with_suffix('.md.backup')
-            claude_md_path.rename(backup_path)
-            print(f"📦 {name} - Backed up existing CLAUDE.md")
+        if changed_at is not None:
+            try:
+                if claude_md_path.stat().st_mtime >= changed_at:
+                    report(f"✓ {name} - CLAUDE.md already up to date")
+                    return True
+            except FileNotFoundError:
+                pass
 
         # Generate new content
-        content = generate_claude_md(project_id, name, path, description)
+        content = generate_claude_md(project_id, name, path, description, tasks_text)
+
+        # Leave the file alone when nothing changed, but mark it current so
+        # the mtime check above skips it next time
+        try:
+            if claude_md_path.read_bytes() == content.encode():
+                if changed_at is not None:
+                    os.utime(claude_md_path)
+                report(f"✓ {name} - CLAUDE.md already up to date")
+                return True
+        except FileNotFoundError:
+            pass
+
+        # Backup existing file if requested. A hard link keeps CLAUDE.md in
+        # place until the new content atomically replaces it.
+        if backup and claude_md_path.exists():
+            backup_path = claude_md_path.with_suffix('.md.backup')
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(claude_md_path, backup_path)
+            except OSError:
+                shutil.copy2(claude_md_path, backup_path)  # No hard links on this filesystem
+            report(f"📦 {name} - Backed up existing CLAUDE.md")
 
         # Write enhanced CLAUDE.md
-        with open(claude_md_path, 'w') as f:
-            f.write(content)
+        write_file_atomic(claude_md_path, content)
 
-        print(f"✓ {name} - Enhanced CLAUDE.md created")
+        report(f"✓ {name} - Enhanced CLAUDE.md created")
         return True
 
     except Exception as e:
-        print(f"✗ {name} - Failed to enhance CLAUDE.md: {e}")
+        report(f"✗ {name} - Failed to enhance CLAUDE.md: {e}")
         return False
 
+def write_file_atomic(file_path, content):
+    """Replace file_path with content so readers never see a partial file."""
+    try:
+        mode = file_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    tmp = tempfile.NamedTemporaryFile('w', dir=file_path.parent, prefix=f'.{file_path.name}.',
+                                      suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(content)
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, file_path)
+    except Exception:
+        os.unlink(tmp.name)
+        raise
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,114 +1,136 @@
 #!/usr/bin/env python3
 
-import sqlite3
-import subprocess
+import atexit
+import functools
 import sys
 import re
 from pathlib import Path
-from datetime import datetime
 
 def get_project_tracker_db():
     """Get path to project tracker database."""
     data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
     return data_dir / 'tracker.db'
 
-def get_git_repo_path():
-    """Get the current Git repository path."""
+@functools.lru_cache(maxsize=1)
+def get_connection():
+    """Open the tracker database once per process and reuse the connection."""
+    # Imported here so commits in untracked setups never load the extension
+    import sqlite3
+
+    conn = sqlite3.connect(get_project_tracker_db())
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    atexit.register(conn.close)
+    return conn
+
+def get_git_head():
+    """Get the repository path, HEAD commit hash and branch in one git call."""
+    import subprocess
+
     try:
-        repo_path = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'],
-                                          stderr=subprocess.DEVNULL).decode().strip()
-        return repo_path
+        output = subprocess.check_output(['git', 'rev-parse', '--show-toplevel', 'HEAD',
+                                          '--abbrev-ref', 'HEAD'],
+                                         text=True, stderr=subprocess.DEVNULL)
+        repo_path, commit_hash, branch = output.splitlines()
+        # A detached HEAD has no branch name
+        return repo_path, commit_hash, '' if branch == 'HEAD' else branch
     except:
         return None
 
 def find_project_by_path(repo_path):
     """Find project ID by repository path."""
-    db_path = get_project_tracker_db()
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute('SELECT id, name FROM projects WHERE path = ?', (repo_path,))
-    result = cursor.fetchone()
-    conn.close()
-
-    return result
+    return cursor.fetchone()
+
+# Look for patterns like:
+# "pt:123 completed" or "pt:123 done" - mark task as completed
+# "pt:123 progress" or "pt:123 working" - mark task as in progress
+# "pt:123 blocked" - mark task as blocked
+# "pt:123" - just log activity
+# One alternation so a single pass finds every reference and its verb
+TASK_REF_PATTERN = re.compile(
+    r'pt:(?P<task_id>\d+)'
+    r'(?:\s+(?:(?P<completed>completed?|done|finished?)'
+    r'|(?P<in_progress>progress|working|started?)'
+    r'|(?P<blocked>blocked?)))?',
+    re.IGNORECASE
+)
+TASK_ACTIONS = ('completed', 'in_progress', 'blocked', 'activity')
 
 def parse_commit_message(message):
     """Parse commit message for task references and updates."""
-    # Look for patterns like:
-    # "pt:123 completed" or "pt:123 done" - mark task as completed
-    # "pt:123 progress" or "pt:123 working" - mark task as in progress
-    # "pt:123 blocked" - mark task as blocked
-    # "pt:123" - just log activity
-
-    patterns = {
-        r'pt:(\d+)\s+(completed?|done|finished?)': 'completed',
-        r'pt:(\d+)\s+(progress|working|started?)': 'in_progress',
-        r'pt:(\d+)\s+(blocked?)': 'blocked',
-        r'pt:(\d+)': 'activity'
-    }
-
-    updates = []
-    for pattern, action in patterns.items():
-        matches = re.finditer(pattern, message.lower())
-        for match in matches:
-            task_id = int(match.group(1))
-            updates.append((task_id, action))
-            # Only process the first match per task to avoid conflicts
-            break
-
-    return updates
-
-def update_task_from_git(task_id, action, commit_hash, message, project_id):
-    """Update task based on Git commit."""
-    db_path = get_project_tracker_db()
-    conn = sqlite3.connect(db_path)
+    # Only the first reference per action is processed to avoid conflicts
+    first_refs = {}
+    for match in TASK_REF_PATTERN.finditer(message):
+        task_id = int(match.group('task_id'))
+        first_refs.setdefault('activity', task_id)
+        if match.lastgroup != 'task_id':
+            first_refs.setdefault(match.lastgroup, task_id)
+
+    return [(first_refs[action], action) for action in TASK_ACTIONS if action in first_refs]
+
+def update_tasks_from_git(updates, commit_hash, branch, message, project_id):
+    """Update tasks based on a Git commit, in a single transaction.
+
+    Returns a (success, message) pair for each update, in order.
+    """
+    conn = get_connection()
     cursor = conn.cursor()
 
-    # Verify task exists and belongs to this project
-    cursor.execute('SELECT title FROM tasks WHERE id = ? AND project_id = ?',
-                   (task_id, project_id))
-    result = cursor.fetchone()
-    if not result:
-        conn.close()
-        return False, f"Task {task_id} not found in this project"
-
-    task_title = result[0]
-
-    # Log Git activity
-    try:
-        branch = subprocess.check_output(['git', 'branch', '--show-current'],
-                                       stderr=subprocess.DEVNULL).decode().strip()
-    except:
-        branch = 'unknown'
-
-    cursor.execute('''
-        INSERT INTO git_activity (project_id, task_id, commit_hash, branch_name, message)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (project_id, task_id, commit_hash, branch, message))
-
-    # Update task status if specified
-    if action in ['completed', 'in_progress', 'blocked']:
-        cursor.execute('UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
-                      (action, task_id))
-
-        # Update project timestamp
-        cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?',
-                       (project_id,))
-
-    conn.commit()
-    conn.close()
-
-    return True, f"Updated task '{task_title}' -> {action}"
+    # Verify tasks exist and belong to this project
+    task_ids = sorted({task_id for task_id, _ in updates})
+    placeholders = ', '.join('?' * len(task_ids))
+    cursor.execute(f'SELECT id, title FROM tasks WHERE project_id = ? AND id IN ({placeholders})',
+                   (project_id, *task_ids))
+    task_titles = dict(cursor.fetchall())
+
+    results = []
+    activity_rows = []
+    statuses = {}  # Later updates to the same task win, as when applied in turn
+    for task_id, action in updates:
+        if task_id not in task_titles:
+            results.append((False, f"Task {task_id} not found in this project"))
+            continue
+
+        activity_rows.append((project_id, task_id, commit_hash, branch, message))
+        if action in ['completed', 'in_progress', 'blocked']:
+            statuses[task_id] = action
+        results.append((True, f"Updated task '{task_titles[task_id]}' -> {action}"))
+
+    with conn:
+        # Log Git activity
+        cursor.executemany('''
+            INSERT INTO git_activity (project_id, task_id, commit_hash, branch_name, message)
+            VALUES (?, ?, ?, ?, ?)
+        ''', activity_rows)
+
+        # Update task statuses in one statement, then the project timestamp
+        if statuses:
+            values = ', '.join(['(?, ?)'] * len(statuses))
+            cursor.execute(f'''
+                WITH x(id, status) AS (VALUES {values})
+                UPDATE tasks
+                SET status = (SELECT status FROM x WHERE x.id = tasks.id),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id IN (SELECT id FROM x)
+            ''', [param for item in statuses.items() for param in item])
+
+            cursor.execute('UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                           (project_id,))
+
+    return results
 
 def main():
     """Main post-commit hook function."""
-    repo_path = get_git_repo_path()
-    if not repo_path:
+    if not get_project_tracker_db().exists():
+        sys.exit(0)  # Project tracker not set up, silently exit
+
+    git_head = get_git_head()
+    if not git_head:
         sys.exit(0)  # Not in a Git repo, silently exit
+    repo_path, commit_hash, branch = git_head
 
     project_result = find_project_by_path(repo_path)
     if not project_result:
@@ -116,12 +138,12 @@ def main():
 
     project_id, project_name = project_result
 
-    # Get latest commit info
+    # Get latest commit message
+    import subprocess
+
     try:
-        commit_hash = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
-                                            stderr=subprocess.DEVNULL).decode().strip()
         commit_message = subprocess.check_output(['git', 'log', '-1', '--pretty=format:%s'],
-                                               stderr=subprocess.DEVNULL).decode().strip()
+                                               text=True, stderr=subprocess.DEVNULL).strip()
     except:
         sys.exit(0)  # Can't get Git info, silently exit
 
@@ -131,9 +153,8 @@ def main():
     if updates:
         print(f"🔗 Project Tracker: Processing {len(updates)} task update(s) for '{project_name}'")
 
-        for task_id, action in updates:
-            success, message = update_task_from_git(task_id, action, commit_hash[:8],
-                                                   commit_message, project_id)
+        for success, message in update_tasks_from_git(updates, commit_hash[:8], branch,
+                                                      commit_message, project_id):
             if success:
                 print(f"   ✓ {message}")
             else:
@@ -11,11 +11,11 @@ def get_project_tracker_db():
     data_dir = Path.home() / '.local' / 'share' / 'project-tracker'
     return data_dir / 'tracker.db'
 
-def setup_git_hooks(project_path):
-    """Set up Git hooks for a project."""
+def setup_git_hooks(project_path, report=print):
+    """Set up Git hooks for a project, passing status messages to report."""
     hooks_dir = Path(project_path) / '.git' / 'hooks'
     if not hooks_dir.exists():
-        print(f"✗ {project_path} - Not a Git repository")
+        report(f"✗ {project_path} - Not a Git repository")
         return False
 
     # Create post-commit hook
@@ -29,10 +29,10 @@ def setup_git_hooks(project_path):
         with open(post_commit_hook, 'w') as f:
             f.write(hook_content)
         post_commit_hook.chmod(0o755)
-        print(f"✓ {project_path} - Git hook installed")
+        report(f"✓ {project_path} - Git hook installed")
         return True
     except Exception as e:
-        print(f"✗ {project_path} - Failed to install hook: {e}")
+        report(f"✗ {project_path} - Failed to install hook: {e}")
         return False
 
 def main():
@@ -49,12 +49,19 @@ def main():
         # Setup for specific project
         project_ref = sys.argv[1]
         try:
-            project_id = int(project_ref)
-            cursor.execute('SELECT name, path FROM projects WHERE id = ?', (project_id,))
+            cursor.execute('SELECT name, path FROM projects WHERE id = ?', (int(project_ref),))
+            result = cursor.fetchone()
         except ValueError:
-            cursor.execute('SELECT name, path FROM projects WHERE name LIKE ?', (f'%{project_ref}%',))
+            # Exact, then prefix (both indexed), then substring as a last resort
+            result = None
+            for clause, param in (('name = ?', project_ref),
+                                  ('name LIKE ?', f'{project_ref}%'),
+                                  ('name LIKE ?', f'%{project_ref}%')):
+                cursor.execute(f'SELECT name, path FROM projects WHERE {clause} LIMIT 1', (param,))
+                result = cursor.fetchone()
+                if result:
+                    break
 
-        result = cursor.fetchone()
         if not result:
             print(f"✗ Project '{project_ref}' not found")
             sys.exit(1)
@@ -76,14 +83,26 @@ def main():
             sys.exit(1)
 
         print(f"Setting up Git hooks for {len(projects)} project(s)...")
-        success_count = 0
 
-        for name, path in projects:
+        def install(project):
+            name, path = project
+            messages = []
             if path and os.path.exists(path):
-                if setup_git_hooks(path):
-                    success_count += 1
+                success = setup_git_hooks(path, messages.append)
             else:
-                print(f"✗ {name} - Path '{path}' does not exist")
+                messages.append(f"✗ {name} - Path '{path}' does not exist")
+                success = False
+            return success, messages
+
+        # Projects are independent file IO; messages are printed in project order
+        from concurrent.futures import ThreadPoolExecutor
+
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+            for success, messages in executor.map(install, projects):
+                for message in messages:
+                    print(message)
+                success_count += success
 
         print(f"\n✓ Successfully set up Git hooks for {success_count}/{len(projects)} projects")
 